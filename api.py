@@ -0,0 +1,333 @@
+"""
+Headless JSON API for the Interview Outcome Viewer.
+
+Serves interview summaries, filter values and detail documents for automated
+consumers (ATS sync, reporting jobs) without going through the Streamlit UI.
+Reuses the CosmosDBConnection data layer, compresses large responses with gzip
+and supports ETag / If-None-Match so pollers get cheap 304 responses.
+
+Run with:
+    python api.py
+
+Endpoints:
+    GET /api/interviews?offset=0&limit=50&position=...&verdict=...&q=...
+    GET /api/interviews/<id>
+    GET /api/filters
+
+Every request must send "Authorization: Bearer <API_TOKEN>" when API_TOKEN is
+set. The server refuses to bind to a non-loopback address without a token.
+"""
+import gzip
+import hashlib
+import hmac
+import ipaddress
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+# Load environment variables from .env file if it exists
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass  # python-dotenv not installed, skip loading .env file
+
+from config import API_CONFIG
+from cosmos_db import get_cosmos_connection
+
+
+class ApiError(Exception):
+    """An error that maps directly to an HTTP status code"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _parse_int(params: Dict[str, list], name: str, default: int) -> int:
+    """Read a non-negative integer query parameter"""
+    values = params.get(name)
+    if not values:
+        return default
+    try:
+        value = int(values[0])
+    except ValueError:
+        raise ApiError(400, f"'{name}' must be an integer")
+    if value < 0:
+        raise ApiError(400, f"'{name}' must not be negative")
+    return value
+
+
+def _parse_str(params: Dict[str, list], name: str) -> Optional[str]:
+    """Read an optional string query parameter"""
+    values = params.get(name)
+    if not values:
+        return None
+    return values[0].strip() or None
+
+
+def _is_loopback(host: str) -> bool:
+    """Whether a bind address only accepts local connections"""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _is_authorized(authorization: Optional[str]) -> bool:
+    """Check an Authorization header against the configured bearer token"""
+    token = API_CONFIG["token"]
+    if not token:
+        return True
+    scheme, _, credentials = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer":
+        return False
+    return hmac.compare_digest(credentials.strip().encode("utf-8"), token.encode("utf-8"))
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values"""
+    qualities = {}
+    for entry in (accept_encoding or "").split(","):
+        coding, *options = [part.strip() for part in entry.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for option in options:
+            name, _, value = option.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def _weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from the given values"""
+    digest = hashlib.sha1(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weak prefix from an ETag"""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(_opaque_tag(tag) == _opaque_tag(etag) for tag in if_none_match.split(","))
+
+
+_version_cache: Dict[Tuple, Tuple[float, Tuple[int, int]]] = {}
+_version_cache_lock = threading.Lock()
+
+
+def _summary_version(position: Optional[str] = None,
+                     verdict: Optional[str] = None,
+                     search: Optional[str] = None,
+                     refresh: bool = False) -> Tuple[int, int]:
+    """
+    (count, latest _ts) for a filter set, reused for a few seconds so many
+    pollers share one version check instead of each running their own.
+    With refresh=True the cache is bypassed and updated with a fresh read.
+    """
+    key = (position, verdict, search)
+    now = time.monotonic()
+    if not refresh:
+        with _version_cache_lock:
+            cached = _version_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+
+    version = get_cosmos_connection().query_summary_version(position, verdict, search)
+
+    with _version_cache_lock:
+        # Drop expired entries so arbitrary search terms don't accumulate
+        for stale_key in [k for k, (expires, _) in _version_cache.items() if expires <= now]:
+            del _version_cache[stale_key]
+        _version_cache[key] = (now + API_CONFIG["version_ttl_seconds"], version)
+    return version
+
+
+# Each handler returns (etag, body_factory); the body factory is only called
+# when the client does not already hold the current version, and returns
+# (payload, etag) so a handler can send a fresher ETag alongside the body
+Handler = Tuple[str, Callable[[], Tuple[Any, str]]]
+
+
+def list_interviews(params: Dict[str, list]) -> Handler:
+    """Paginated, filterable interview summaries"""
+    offset = _parse_int(params, "offset", 0)
+    limit = _parse_int(params, "limit", API_CONFIG["default_page_size"])
+    if limit == 0 or limit > API_CONFIG["max_page_size"]:
+        raise ApiError(400, f"'limit' must be between 1 and {API_CONFIG['max_page_size']}")
+    filters = {
+        "position": _parse_str(params, "position"),
+        "verdict": _parse_str(params, "verdict"),
+        "search": _parse_str(params, "q"),
+    }
+
+    cosmos_conn = get_cosmos_connection()
+    total, max_ts = _summary_version(**filters)
+    etag = _weak_etag("interviews", total, max_ts, offset, limit, filters)
+
+    def body():
+        # Re-read the version next to the page so total/next_offset and the
+        # ETag describe the same data as the items, not the cached version
+        fresh_total, fresh_max_ts = _summary_version(**filters, refresh=True)
+        items = cosmos_conn.query_summary_page(offset, limit, **filters)
+        next_offset = offset + len(items)
+        payload = {
+            "items": items,
+            "offset": offset,
+            "limit": limit,
+            "total": fresh_total,
+            "next_offset": next_offset if next_offset < fresh_total else None,
+        }
+        return payload, _weak_etag("interviews", fresh_total, fresh_max_ts, offset, limit, filters)
+
+    return etag, body
+
+
+def get_filters(params: Dict[str, list]) -> Handler:
+    """Distinct positions and verdicts available for filtering"""
+    cosmos_conn = get_cosmos_connection()
+    total, max_ts = _summary_version()
+    etag = _weak_etag("filters", total, max_ts)
+    return etag, lambda: (cosmos_conn.query_filter_values(), etag)
+
+
+def _strong_etag(cosmos_etag: str) -> str:
+    """Cosmos _etag values are usually already quoted strong validators"""
+    return cosmos_etag if cosmos_etag.startswith('"') else f'"{cosmos_etag}"'
+
+
+def get_interview(document_id: str) -> Handler:
+    """Full interview document, versioned by its Cosmos _etag"""
+    cosmos_conn = get_cosmos_connection()
+    cosmos_etag = cosmos_conn.query_interview_etag(document_id)
+    if cosmos_etag is None:
+        raise ApiError(404, f"Interview '{document_id}' not found")
+
+    def body():
+        document = cosmos_conn.query_interview(document_id)
+        if document is None:
+            raise ApiError(404, f"Interview '{document_id}' not found")
+        # The document may have changed since the ETag lookup
+        return document, _strong_etag(document.get("_etag", cosmos_etag))
+
+    return _strong_etag(cosmos_etag), body
+
+
+class InterviewApiHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the API handlers"""
+
+    server_version = "InterviewOutcomeAPI/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        path = url.path.rstrip("/")
+
+        # Resolve the full response before any headers go out, so a failure
+        # while querying can still be reported with a proper status
+        etag = None
+        try:
+            if not _is_authorized(self.headers.get("Authorization")):
+                raise ApiError(401, "Missing or invalid bearer token")
+
+            if path == "/api/interviews":
+                etag, body = list_interviews(params)
+            elif path == "/api/filters":
+                etag, body = get_filters(params)
+            elif path.startswith("/api/interviews/"):
+                etag, body = get_interview(unquote(path[len("/api/interviews/"):]))
+            else:
+                raise ApiError(404, "Not found")
+
+            if _etag_matches(self.headers.get("If-None-Match"), etag):
+                status, payload = 304, None
+            else:
+                payload, etag = body()
+                status = 200
+        except ApiError as e:
+            status, payload, etag = e.status, {"error": e.message}, None
+        except Exception as e:
+            self.log_error("Request failed: %s", e)
+            status, payload, etag = 503, {"error": "Failed to query interview data"}, None
+
+        try:
+            self._send_json(status, payload, etag)
+        except (BrokenPipeError, ConnectionResetError) as e:
+            # The client went away mid-response; nothing more can be sent
+            self.log_error("Client disconnected: %s", e)
+
+    def _send_json(self, status: int, payload: Any, etag: Optional[str] = None):
+        """Serialize a JSON payload, gzip-compressing it when the client accepts it"""
+        if status == 304:
+            data = b""
+            compress = False
+        else:
+            data = json.dumps(payload, default=str).encode("utf-8")
+            compress = (
+                len(data) >= API_CONFIG["gzip_min_bytes"]
+                and _accepts_gzip(self.headers.get("Accept-Encoding"))
+            )
+            if compress:
+                data = gzip.compress(data)
+
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+        self.send_header("Vary", "Accept-Encoding")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if status == 401:
+            self.send_header("WWW-Authenticate", "Bearer")
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+
+def main():
+    """Start the API server"""
+    if not API_CONFIG["token"] and not _is_loopback(API_CONFIG["host"]):
+        raise SystemExit(
+            f"Refusing to bind to {API_CONFIG['host']} without API_TOKEN set; "
+            "the API serves candidate data and transcripts"
+        )
+    if not API_CONFIG["token"]:
+        print("Warning: API_TOKEN is not set, requests are not authenticated (loopback only)")
+
+    server = ThreadingHTTPServer((API_CONFIG["host"], API_CONFIG["port"]), InterviewApiHandler)
+    print(f"Interview API listening on http://{API_CONFIG['host']}:{API_CONFIG['port']}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 from cosmos_db import get_cosmos_connection
+from models import format_interview_date, summaries_to_columns
 from typing import Dict, Any
 import os
 
@@ -143,7 +144,7 @@ st.markdown(f"""
 </style>
 """, unsafe_allow_html=True)
 
-def show_conversation(conversation_data):
+def show_conversation(conversation):
     """Display conversation in a chat-like format"""
     st.markdown("### 💬 Interview Conversation")
     
@@ -151,9 +152,9 @@ def show_conversation(conversation_data):
     container = st.container()
     
     with container:
-        for i, msg in enumerate(conversation_data):
-            role = msg.get("role", "")
-            message = msg.get("message", "")
+        for msg in conversation:
+            role = msg.role
+            message = msg.message
             
             if role == "user":
                 # User message - right aligned
@@ -189,68 +190,68 @@ def show_conversation(conversation_data):
                 </div>
                 """, unsafe_allow_html=True)
 
-def show_candidate_profile(profile_data):
+def show_candidate_profile(profile):
     """Display candidate profile information"""
     st.markdown("### 👤 Candidate Profile")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown(f"**Name:** {profile_data.get('candidate_name', 'N/A')}")
-        st.markdown(f"**Position Applied:** {profile_data.get('position_applied', 'N/A')}")
-        st.markdown(f"**Recording Consent:** {'✅ Yes' if profile_data.get('consent_recording') else '❌ No'}")
+        st.markdown(f"**Name:** {profile.candidate_name}")
+        st.markdown(f"**Position Applied:** {profile.position_applied}")
+        st.markdown(f"**Recording Consent:** {'✅ Yes' if profile.consent_recording else '❌ No'}")
     
     with col2:
-        st.markdown(f"**Current Role:** {profile_data.get('current_role_title', 'N/A')}")
-        st.markdown(f"**Current Organization:** {profile_data.get('current_role_org', 'N/A')}")
-        st.markdown(f"**Travel Acknowledgment:** {profile_data.get('hybrid_travel_ack', 'N/A')}")
+        st.markdown(f"**Current Role:** {profile.current_role_title}")
+        st.markdown(f"**Current Organization:** {profile.current_role_org}")
+        st.markdown(f"**Travel Acknowledgment:** {profile.hybrid_travel_ack}")
 
-def show_tech_probe(tech_data):
+def show_tech_probe(tech_probe):
     """Display technical probe information"""
     st.markdown("### 🔧 Technical Assessment")
     
-    st.markdown(f"**Topic:** {tech_data.get('tech_probe_topic', 'N/A')}")
-    st.markdown(f"**Summary:** {tech_data.get('tech_probe_summary', 'N/A')}")
-    st.markdown(f"**Follow-ups Used:** {tech_data.get('followups_used', 0)}")
+    st.markdown(f"**Topic:** {tech_probe.topic}")
+    st.markdown(f"**Summary:** {tech_probe.summary}")
+    st.markdown(f"**Follow-ups Used:** {tech_probe.followups_used}")
 
-def show_interview_feedback(feedback_data):
+def show_interview_feedback(feedback):
     """Display interview feedback and assessment"""
     st.markdown("### 📋 Interview Feedback")
     
     # Role Suitability
-    role_suit = feedback_data.get('role_suitability', {})
-    verdict = role_suit.get('verdict', 'N/A')
+    role_suit = feedback.role_suitability
+    verdict = role_suit.verdict
     
     verdict_class = "verdict-go" if verdict == "GO" else "verdict-no-go"
     st.markdown(f"""
     <div class="assessment-section">
         <h4>🎯 Role Suitability</h4>
         <p><strong>Verdict:</strong> <span class="{verdict_class}">{verdict}</span></p>
-        <p><strong>Justification:</strong> {role_suit.get('justification', 'N/A')}</p>
+        <p><strong>Justification:</strong> {role_suit.justification}</p>
     </div>
     """, unsafe_allow_html=True)
     
     # Communication Skills
-    comm_skills = feedback_data.get('communication_skills', {})
+    comm_skills = feedback.communication_skills
     st.markdown(f"""
     <div class="assessment-section">
         <h4>🗣️ Communication Skills</h4>
-        <p><strong>Assessment:</strong> {comm_skills.get('assessment', 'N/A')}</p>
-        <p><strong>Reasoning:</strong> {comm_skills.get('reasoning', 'N/A')}</p>
+        <p><strong>Assessment:</strong> {comm_skills.assessment}</p>
+        <p><strong>Reasoning:</strong> {comm_skills.reasoning}</p>
     </div>
     """, unsafe_allow_html=True)
     
     # Technical Competence
-    tech_comp = feedback_data.get('technical_competence', {})
+    tech_comp = feedback.technical_competence
     st.markdown(f"""
     <div class="assessment-section">
         <h4>⚙️ Technical Competence</h4>
-        <p><strong>Assessment:</strong> {tech_comp.get('assessment', 'N/A')}</p>
-        <p><strong>Reasoning:</strong> {tech_comp.get('reasoning', 'N/A')}</p>
+        <p><strong>Assessment:</strong> {tech_comp.assessment}</p>
+        <p><strong>Reasoning:</strong> {tech_comp.reasoning}</p>
     </div>
     """, unsafe_allow_html=True)
 
-def show_interview_detail(interview_data):
+def show_interview_detail(interview):
     """Show detailed view of a single interview"""
     company_name = CUSTOMER_CONFIG["company_name"]
     st.markdown(f'<h1 class="main-header">📄 {company_name} Interview Details</h1>', unsafe_allow_html=True)
@@ -265,48 +266,38 @@ def show_interview_detail(interview_data):
     
     with col1:
         # Candidate Profile
-        show_candidate_profile(interview_data.get('candidate_profile', {}))
+        show_candidate_profile(interview.candidate_profile)
         st.markdown("---")
         
         # Technical Probe
-        show_tech_probe(interview_data.get('tech_probe', {}))
+        show_tech_probe(interview.tech_probe)
         st.markdown("---")
         
         # Interview Feedback
-        show_interview_feedback(interview_data.get('interview_feedback', {}))
+        show_interview_feedback(interview.interview_feedback)
         
         # Document metadata
         st.markdown("### 📄 Document Info")
-        st.markdown(f"**Document ID:** `{interview_data.get('id', 'N/A')}`")
+        st.markdown(f"**Document ID:** `{interview.id}`")
         
         # Display interview date
-        interview_date = interview_data.get('interview_date', 'N/A')
-        if interview_date and interview_date != 'N/A':
-            try:
-                # Parse and format the date for better display
-                from datetime import datetime
-                if isinstance(interview_date, str):
-                    date_obj = datetime.fromisoformat(interview_date.replace('Z', '+00:00'))
-                    formatted_date = date_obj.strftime('%B %d, %Y')
-                    st.markdown(f"**Interview Date:** {formatted_date}")
-                else:
-                    st.markdown(f"**Interview Date:** {interview_date}")
-            except:
-                st.markdown(f"**Interview Date:** {interview_date}")
-        else:
-            st.markdown(f"**Interview Date:** N/A")
+        interview_date = format_interview_date(interview.interview_date, '%B %d, %Y')
+        st.markdown(f"**Interview Date:** {interview_date or 'N/A'}")
         
-        if '_ts' in interview_data:
-            timestamp = datetime.fromtimestamp(interview_data['_ts'])
+        if interview.last_modified is not None:
+            timestamp = datetime.fromtimestamp(interview.last_modified)
             st.markdown(f"**Last Modified:** {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
     
     with col2:
-        # Conversation
-        conversation_data = interview_data.get('conversation', [])
-        if conversation_data:
-            show_conversation(conversation_data)
-        else:
-            st.warning("No conversation data available for this interview.")
+        # The conversation is only queried once the reviewer turns the
+        # transcript on (an expander would still run its body)
+        if st.toggle("💬 Show interview conversation", key=f"show_conversation_{interview.id}"):
+            with st.spinner("Loading conversation..."):
+                conversation = get_cosmos_connection().get_interview_conversation(interview.id)
+            if conversation:
+                show_conversation(conversation)
+            else:
+                st.warning("No conversation data available for this interview.")
 
 def show_interview_grid():
     """Show the main grid view of interviews"""
@@ -344,11 +335,11 @@ def show_interview_grid():
         return
     
     # Convert to DataFrame for better display
-    df = pd.DataFrame(interview_summary)
+    df = pd.DataFrame(summaries_to_columns(interview_summary))
     
     # Debug: Show the actual data structure
-    if st.checkbox("🔍 Debug: Show raw data"):
-        st.json(interview_summary[:1] if interview_summary else [])  # Show first record
+    if st.checkbox("🔍 Debug: Show parsed summary record"):
+        st.json([s.to_dict() for s in interview_summary[:1]])  # Show first record
     
     # Show current configuration
     if st.checkbox("🔧 Show configuration"):
@@ -489,10 +480,10 @@ def main():
         cosmos_conn = get_cosmos_connection()
         
         with st.spinner("Loading interview details..."):
-            interview_data = cosmos_conn.get_interview_by_id(st.session_state.selected_interview)
+            interview = cosmos_conn.get_interview_by_id(st.session_state.selected_interview)
         
-        if interview_data:
-            show_interview_detail(interview_data)
+        if interview:
+            show_interview_detail(interview)
         else:
             st.error("Interview not found or unable to load.")
             st.session_state.selected_interview = None
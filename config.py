@@ -45,4 +45,19 @@ DISPLAY_CONFIG = {
     "conversation_max_height": "600px",
     "max_records_per_page": 50,
     "search_placeholder": f"Search candidates for {CUSTOMER_CONFIG['company_name']} positions..."
-}
\ No newline at end of file
+}
+
+# Headless API Configuration (api.py)
+# Can be overridden by environment variables
+API_CONFIG = {
+    "host": os.getenv("API_HOST", "127.0.0.1"),
+    "port": int(os.getenv("API_PORT", "8080")),
+    # Bearer token required on every request; mandatory when binding to a
+    # non-loopback address
+    "token": os.getenv("API_TOKEN", ""),
+    "default_page_size": int(os.getenv("API_DEFAULT_PAGE_SIZE", "50")),
+    "max_page_size": int(os.getenv("API_MAX_PAGE_SIZE", "200")),
+    "gzip_min_bytes": int(os.getenv("API_GZIP_MIN_BYTES", "1024")),
+    # How long the count/_ts version used for ETags is reused across requests
+    "version_ttl_seconds": float(os.getenv("API_VERSION_TTL_SECONDS", "5"))
+}
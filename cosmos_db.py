@@ -2,8 +2,49 @@ import os
 import streamlit as st
 from azure.cosmos import CosmosClient
 from azure.identity import DefaultAzureCredential
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from config import COSMOS_DB_CONFIG
+from models import ConversationMessage, InterviewDetail, InterviewSummary, parse_conversation
+
+# Projection used for summary listings so they never pull the (large)
+# conversation array over the wire
+SUMMARY_PROJECTION = (
+    "c.id, c.interview_date, "
+    "c.candidate_profile.candidate_name AS candidate_name, "
+    "c.candidate_profile.position_applied AS position_applied, "
+    "c.interview_feedback.role_suitability.verdict AS verdict, "
+    "c._ts"
+)
+
+# Projection for the detail view; the conversation is fetched separately by
+# get_interview_conversation when the transcript is rendered
+DETAIL_PROJECTION = (
+    "c.id, c.interview_date, c.candidate_profile, c.tech_probe, "
+    "c.interview_feedback, c._ts"
+)
+
+def build_summary_filter(position: Optional[str] = None,
+                         verdict: Optional[str] = None,
+                         search: Optional[str] = None) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Build a parameterized WHERE clause for summary queries
+    """
+    conditions = []
+    parameters = []
+    if position:
+        conditions.append("c.candidate_profile.position_applied = @position")
+        parameters.append({"name": "@position", "value": position})
+    if verdict:
+        conditions.append("c.interview_feedback.role_suitability.verdict = @verdict")
+        parameters.append({"name": "@verdict", "value": verdict})
+    if search:
+        conditions.append(
+            "(CONTAINS(c.candidate_profile.candidate_name, @search, true) OR "
+            "CONTAINS(c.candidate_profile.position_applied, @search, true))"
+        )
+        parameters.append({"name": "@search", "value": search})
+    where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where_clause, parameters
 
 class CosmosDBConnection:
     """
@@ -58,8 +99,10 @@ class CosmosDBConnection:
             st.error(f"Failed to retrieve interviews: {str(e)}")
             return []
     
-    @st.cache_data
-    def get_interview_by_id(_self, document_id: str) -> Optional[Dict[str, Any]]:
+    # Parsed models are shared across reruns via cache_resource rather than
+    # being unpickled into a fresh copy on every rerun by cache_data
+    @st.cache_resource
+    def get_interview_by_id(_self, document_id: str) -> Optional[InterviewDetail]:
         """
         Retrieve a specific interview document by ID
         """
@@ -68,8 +111,8 @@ class CosmosDBConnection:
             return None
         
         try:
-            # Query for specific document
-            query = f"SELECT * FROM c WHERE c.id = @id"
+            # Query for specific document, without its conversation
+            query = f"SELECT {DETAIL_PROJECTION} FROM c WHERE c.id = @id"
             parameters = [{"name": "@id", "value": document_id}]
             
             items = list(container.query_items(
@@ -78,64 +121,155 @@ class CosmosDBConnection:
                 enable_cross_partition_query=True
             ))
             
-            return items[0] if items else None
+            return InterviewDetail.from_document(items[0]) if items else None
         except Exception as e:
             st.error(f"Failed to retrieve interview {document_id}: {str(e)}")
             return None
     
-    @st.cache_data
-    def get_interview_summary(_self) -> List[Dict[str, str]]:
+    @st.cache_resource
+    def get_interview_conversation(_self, document_id: str) -> Tuple[ConversationMessage, ...]:
         """
-        Get a summary view of all interviews (candidate_name, position_applied, id)
+        Retrieve only the conversation of an interview, for the transcript panel
         """
         container = _self._get_container()
         if not container:
-            return []
+            return ()
         
         try:
-            # Query to get all documents, then extract the fields we need
-            query = "SELECT * FROM c"
+            query = "SELECT VALUE c.conversation FROM c WHERE c.id = @id"
+            parameters = [{"name": "@id", "value": document_id}]
             
             items = list(container.query_items(
                 query=query,
+                parameters=parameters,
                 enable_cross_partition_query=True
             ))
             
-            # Transform the data for easier display
-            summary = []
-            for item in items:
-                # Extract candidate info
-                candidate_profile = item.get("candidate_profile", {})
-                interview_feedback = item.get("interview_feedback", {})
-                role_suitability = interview_feedback.get("role_suitability", {})
-                
-                # Format interview date for display
-                interview_date = item.get("interview_date", "N/A")
-                if interview_date and interview_date != "N/A":
-                    try:
-                        # Parse and format the date for better display
-                        from datetime import datetime
-                        if isinstance(interview_date, str):
-                            date_obj = datetime.fromisoformat(interview_date.replace('Z', '+00:00'))
-                            interview_date = date_obj.strftime("%Y-%m-%d")
-                    except:
-                        # If parsing fails, keep the original value
-                        pass
-                
-                summary.append({
-                    "id": item.get("id", "Unknown"),
-                    "interview_date": interview_date,
-                    "candidate_name": candidate_profile.get("candidate_name", "N/A"),
-                    "position_applied": candidate_profile.get("position_applied", "N/A"),
-                    "verdict": role_suitability.get("verdict", "N/A")
-                })
+            return parse_conversation(items[0]) if items else ()
+        except Exception as e:
+            st.error(f"Failed to retrieve conversation for interview {document_id}: {str(e)}")
+            return ()
+    
+    @st.cache_resource
+    def get_interview_summary(_self) -> Tuple[InterviewSummary, ...]:
+        """
+        Get a summary view of all interviews (candidate_name, position_applied, id)
+        """
+        container = _self._get_container()
+        if not container:
+            return ()
+        
+        try:
+            # Only project the fields the summary needs
+            query = f"SELECT {SUMMARY_PROJECTION} FROM c"
+            
+            items = container.query_items(
+                query=query,
+                enable_cross_partition_query=True
+            )
             
-            return summary
+            return tuple(InterviewSummary.from_item(item) for item in items)
         except Exception as e:
             st.error(f"Failed to retrieve interview summary: {str(e)}")
             # Let's also print the actual error for debugging
             st.error(f"Debug info: {e}")
-            return []
+            return ()
+
+    # ------------------------------------------------------------------
+    # Uncached queries used by the headless API (api.py). These bypass the
+    # Streamlit caches so pollers always see fresh data, and let errors
+    # propagate so the API can report them instead of returning empty data.
+    # ------------------------------------------------------------------
+
+    def _query(self, query: str, parameters: Optional[List[Dict[str, Any]]] = None) -> List[Any]:
+        """Run a cross-partition query and return all results"""
+        container = self._get_container()
+        if not container:
+            raise RuntimeError("Cosmos DB container is not available")
+        return list(container.query_items(
+            query=query,
+            parameters=parameters or [],
+            enable_cross_partition_query=True
+        ))
+
+    def query_summary_version(self, position: Optional[str] = None,
+                              verdict: Optional[str] = None,
+                              search: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Return (document count, latest _ts) for the filtered summary set.
+        Both are aggregates, so callers can derive an ETag without fetching
+        the page itself. Cross-partition aggregates must use SELECT VALUE,
+        hence two queries rather than one.
+        """
+        where_clause, parameters = build_summary_filter(position, verdict, search)
+        count = self._query(f"SELECT VALUE COUNT(1) FROM c{where_clause}", parameters)
+        max_ts = self._query(f"SELECT VALUE MAX(c._ts) FROM c{where_clause}", parameters)
+        return (count[0] if count else 0), (max_ts[0] if max_ts and max_ts[0] is not None else 0)
+
+    def query_summary_page(self, offset: int, limit: int,
+                           position: Optional[str] = None,
+                           verdict: Optional[str] = None,
+                           search: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get one page of interview summaries, newest first
+        """
+        where_clause, parameters = build_summary_filter(position, verdict, search)
+        query = (
+            f"SELECT {SUMMARY_PROJECTION} FROM c{where_clause} "
+            "ORDER BY c._ts DESC OFFSET @offset LIMIT @limit"
+        )
+        parameters = parameters + [
+            {"name": "@offset", "value": offset},
+            {"name": "@limit", "value": limit},
+        ]
+        # Raw values for API consumers: the original ISO interview_date and
+        # None for missing fields, rather than the UI's display formatting
+        return [
+            {
+                "id": item.get("id"),
+                "interview_date": item.get("interview_date"),
+                "candidate_name": item.get("candidate_name"),
+                "position_applied": item.get("position_applied"),
+                "verdict": item.get("verdict"),
+                "last_modified": item.get("_ts"),
+            }
+            for item in self._query(query, parameters)
+        ]
+
+    def query_filter_values(self) -> Dict[str, List[str]]:
+        """
+        Get the distinct positions and verdicts available for filtering
+        """
+        positions = self._query(
+            "SELECT DISTINCT VALUE c.candidate_profile.position_applied FROM c"
+        )
+        verdicts = self._query(
+            "SELECT DISTINCT VALUE c.interview_feedback.role_suitability.verdict FROM c"
+        )
+        return {
+            "positions": sorted(p for p in positions if p),
+            "verdicts": sorted(v for v in verdicts if v),
+        }
+
+    def query_interview_etag(self, document_id: str) -> Optional[str]:
+        """
+        Get only the _etag of an interview document, or None if it does not exist
+        """
+        items = self._query(
+            "SELECT VALUE c._etag FROM c WHERE c.id = @id",
+            [{"name": "@id", "value": document_id}]
+        )
+        return items[0] if items else None
+
+    def query_interview(self, document_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a full interview document by ID, or None if it does not exist
+        """
+        items = self._query(
+            "SELECT * FROM c WHERE c.id = @id",
+            [{"name": "@id", "value": document_id}]
+        )
+        return items[0] if items else None
 
 # Global connection instance
 @st.cache_resource
@@ -0,0 +1,214 @@
+"""
+Typed, compact models for interview documents stored in Cosmos DB.
+
+Raw documents are parsed once into compact, immutable records so the UI and
+API no longer walk nested dicts. The records are shared across Streamlit
+sessions through st.cache_resource, so they must not be mutated. Summary rows
+are slotted records, and the detail model leaves out the (large) conversation
+array, which is loaded on its own when the transcript is rendered.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+NOT_AVAILABLE = "N/A"
+
+
+def format_interview_date(interview_date: Any, date_format: str = "%Y-%m-%d") -> Any:
+    """Format an ISO interview date, keeping the original value if it cannot be parsed"""
+    if interview_date and interview_date != NOT_AVAILABLE:
+        try:
+            # Parse and format the date for better display
+            if isinstance(interview_date, str):
+                date_obj = datetime.fromisoformat(interview_date.replace('Z', '+00:00'))
+                interview_date = date_obj.strftime(date_format)
+        except ValueError:
+            # If parsing fails, keep the original value
+            pass
+    return interview_date
+
+
+def _section(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Get a nested object, treating missing or malformed values as empty"""
+    value = data.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+@dataclass(frozen=True)
+class InterviewSummary:
+    """One row of the interview grid"""
+    __slots__ = ("id", "interview_date", "candidate_name", "position_applied",
+                 "verdict", "last_modified")
+
+    id: str
+    interview_date: Any
+    candidate_name: str
+    position_applied: str
+    verdict: str
+    last_modified: Optional[int]
+
+    FIELDS = __slots__
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> "InterviewSummary":
+        """
+        Build a summary from a row projected with cosmos_db.SUMMARY_PROJECTION
+        """
+        return cls(
+            id=item.get("id", "Unknown"),
+            interview_date=format_interview_date(item.get("interview_date", NOT_AVAILABLE)),
+            candidate_name=item.get("candidate_name", NOT_AVAILABLE),
+            position_applied=item.get("position_applied", NOT_AVAILABLE),
+            verdict=item.get("verdict", NOT_AVAILABLE),
+            last_modified=item.get("_ts"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+def summaries_to_columns(summaries: Sequence[InterviewSummary]) -> Dict[str, List[Any]]:
+    """Transpose summary records into columns, ready for pandas.DataFrame"""
+    return {field: [getattr(s, field) for s in summaries] for field in InterviewSummary.FIELDS}
+
+
+@dataclass(frozen=True)
+class CandidateProfile:
+    __slots__ = ("candidate_name", "position_applied", "consent_recording",
+                 "current_role_title", "current_role_org", "hybrid_travel_ack")
+
+    candidate_name: str
+    position_applied: str
+    consent_recording: bool
+    current_role_title: str
+    current_role_org: str
+    hybrid_travel_ack: Any
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CandidateProfile":
+        return cls(
+            candidate_name=data.get("candidate_name", NOT_AVAILABLE),
+            position_applied=data.get("position_applied", NOT_AVAILABLE),
+            consent_recording=bool(data.get("consent_recording")),
+            current_role_title=data.get("current_role_title", NOT_AVAILABLE),
+            current_role_org=data.get("current_role_org", NOT_AVAILABLE),
+            hybrid_travel_ack=data.get("hybrid_travel_ack", NOT_AVAILABLE),
+        )
+
+
+@dataclass(frozen=True)
+class TechProbe:
+    __slots__ = ("topic", "summary", "followups_used")
+
+    topic: str
+    summary: str
+    followups_used: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TechProbe":
+        return cls(
+            topic=data.get("tech_probe_topic", NOT_AVAILABLE),
+            summary=data.get("tech_probe_summary", NOT_AVAILABLE),
+            followups_used=data.get("followups_used", 0),
+        )
+
+
+@dataclass(frozen=True)
+class Assessment:
+    """A free-text assessment with its reasoning"""
+    __slots__ = ("assessment", "reasoning")
+
+    assessment: str
+    reasoning: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Assessment":
+        return cls(
+            assessment=data.get("assessment", NOT_AVAILABLE),
+            reasoning=data.get("reasoning", NOT_AVAILABLE),
+        )
+
+
+@dataclass(frozen=True)
+class RoleSuitability:
+    __slots__ = ("verdict", "justification")
+
+    verdict: str
+    justification: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RoleSuitability":
+        return cls(
+            verdict=data.get("verdict", NOT_AVAILABLE),
+            justification=data.get("justification", NOT_AVAILABLE),
+        )
+
+
+@dataclass(frozen=True)
+class InterviewFeedback:
+    __slots__ = ("role_suitability", "communication_skills", "technical_competence")
+
+    role_suitability: RoleSuitability
+    communication_skills: Assessment
+    technical_competence: Assessment
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "InterviewFeedback":
+        return cls(
+            role_suitability=RoleSuitability.from_dict(_section(data, "role_suitability")),
+            communication_skills=Assessment.from_dict(_section(data, "communication_skills")),
+            technical_competence=Assessment.from_dict(_section(data, "technical_competence")),
+        )
+
+
+@dataclass(frozen=True)
+class ConversationMessage:
+    __slots__ = ("role", "message")
+
+    role: str
+    message: str
+
+
+@dataclass(frozen=True)
+class InterviewDetail:
+    """
+    An interview document without its conversation, which is fetched
+    separately only when the transcript is shown
+    """
+    __slots__ = ("id", "interview_date", "last_modified", "candidate_profile",
+                 "tech_probe", "interview_feedback")
+
+    id: str
+    interview_date: Any
+    last_modified: Optional[int]
+    candidate_profile: CandidateProfile
+    tech_probe: TechProbe
+    interview_feedback: InterviewFeedback
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> "InterviewDetail":
+        """
+        Build a detail from a document projected with
+        cosmos_db.DETAIL_PROJECTION
+        """
+        return cls(
+            id=document.get("id", NOT_AVAILABLE),
+            interview_date=document.get("interview_date", NOT_AVAILABLE),
+            last_modified=document.get("_ts"),
+            candidate_profile=CandidateProfile.from_dict(_section(document, "candidate_profile")),
+            tech_probe=TechProbe.from_dict(_section(document, "tech_probe")),
+            interview_feedback=InterviewFeedback.from_dict(
+                _section(document, "interview_feedback")
+            ),
+        )
+
+
+def parse_conversation(raw_conversation: Any) -> Tuple[ConversationMessage, ...]:
+    """Turn a raw conversation array into ConversationMessage records"""
+    if not isinstance(raw_conversation, list):
+        return ()
+    return tuple(
+        ConversationMessage(role=msg.get("role", ""), message=msg.get("message", ""))
+        for msg in raw_conversation
+        if isinstance(msg, dict)
+    )